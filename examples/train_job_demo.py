@@ -13,53 +13,171 @@ Running it produces a three-span trace:
             └── MockKubernetesBackend.train  [sdk, CLIENT]
 
 Usage:
-    # Spans printed to console (no Docker needed):
+    # Spans printed to console (no Docker needed), one line per span:
     python examples/train_job_demo.py
 
+    # Same, but with the SDK's full JSON dump (attributes, events, status):
+    DEMO_CONSOLE_FULL_SPANS=1 python examples/train_job_demo.py
+
     # Spans sent to Jaeger via OTel Collector:
     docker compose up -d
     python examples/train_job_demo.py
     # Open http://localhost:16686 — service: kubeflow-training-demo
+
+Span batching can be retuned without code changes via the standard OTel
+environment variables. The demo passes its own defaults (in brackets) in
+place of the SDK's; as in the SDK, a malformed value logs a warning and
+falls back to the default:
+
+    OTEL_BSP_MAX_QUEUE_SIZE          spans buffered before dropping   [4096]
+    OTEL_BSP_SCHEDULE_DELAY          ms between export runs           [500]
+    OTEL_BSP_MAX_EXPORT_BATCH_SIZE   spans per export call            [256]
+    OTEL_BSP_EXPORT_TIMEOUT          ms before an export is abandoned [5000]
+
+The defaults suit a short demo that emits a handful of spans; raise the queue
+size and delay for long-running, high-submission-rate processes.
+
+Head sampling is ParentBased(TraceIdRatioBased) with the ratio taken from
+OTEL_TRACES_SAMPLER_ARG [1.0]; e.g. 0.05 keeps roughly 5% of workflows. A
+value that is not a number in [0, 1] logs a warning and falls back to 1.0.
+The sampler is set in code, so OTEL_TRACES_SAMPLER is ignored.
+
+The Resource is built without Resource.create(), so detector plugins are not
+discovered and OTEL_EXPERIMENTAL_RESOURCE_DETECTORS is ignored. Extra resource
+attributes can still be added via OTEL_RESOURCE_ATTRIBUTES, e.g.
+OTEL_RESOURCE_ATTRIBUTES=deployment.environment=dev; the demo's own
+service.* attributes take precedence over it.
 """
+import logging
 import os
 import socket
 import sys
 
 from opentelemetry import trace
-from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.resources import (
+    TELEMETRY_SDK_LANGUAGE,
+    TELEMETRY_SDK_NAME,
+    TELEMETRY_SDK_VERSION,
+    OTELResourceDetector,
+    Resource,
+)
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from opentelemetry.sdk.version import __version__ as otel_sdk_version
 
 # ── Add project root to sys.path so sdk_mock is importable ──────────────────
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from sdk_mock import MockTrainerClient  # noqa: E402
 
+_logger = logging.getLogger(__name__)
+
+_WORKFLOW_ATTRS = {"workflow.name": "llm-fine-tuning"}
+
 
-def _collector_available(host: str = "localhost", port: int = 4317) -> bool:
+def _collector_available(
+    host: str = "localhost", port: int = 4317, timeout: float = 0.05
+) -> bool:
+    # A local collector accepts in well under 50 ms; anything slower is treated
+    # as unreachable so the demo never stalls before falling back to console.
     try:
-        with socket.create_connection((host, port), timeout=1):
+        with socket.create_connection((host, port), timeout=timeout):
             return True
     except OSError:
         return False
 
 
+def _format_span_line(span) -> str:
+    # One compact line per span instead of the default indented JSON dump.
+    return f"{span.name} {span.context.trace_id:032x} {span.context.span_id:016x}\n"
+
+
+def _env_int(name: str, default: int) -> int:
+    # Same leniency as the SDK's own OTEL_BSP_* parsing: warn and fall back.
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        _logger.warning("Invalid value %r for %s; using default %d", value, name, default)
+        return default
+
+
+def _env_ratio(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        ratio = float(value)
+    except ValueError:
+        ratio = -1.0
+    if not 0.0 <= ratio <= 1.0:
+        _logger.warning("Invalid value %r for %s; using default %s", value, name, default)
+        return default
+    return ratio
+
+
+def _make_bsp(exporter) -> BatchSpanProcessor:
+    # The SDK defaults (5 s delay, 512-span batches, 2048 queue) leave the
+    # worker asleep at exit and drop spans under bursts; see the module
+    # docstring for the env overrides.
+    return BatchSpanProcessor(
+        exporter,
+        max_queue_size=_env_int("OTEL_BSP_MAX_QUEUE_SIZE", 4096),
+        schedule_delay_millis=_env_int("OTEL_BSP_SCHEDULE_DELAY", 500),
+        max_export_batch_size=_env_int("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", 256),
+        export_timeout_millis=_env_int("OTEL_BSP_EXPORT_TIMEOUT", 5000),
+    )
+
+
 def _build_provider() -> tuple[TracerProvider, str]:
-    resource = Resource.create({
+    # Resource.create() resolves resource detectors through entry-point
+    # discovery on every start. The demo has a fixed identity, so it only
+    # applies the env-var detector: OTEL_RESOURCE_ATTRIBUTES still works, but
+    # the code-level attributes below take precedence. The spec-required
+    # telemetry.sdk.* attributes that Resource.create() would add are set here.
+    resource = OTELResourceDetector().detect().merge(Resource({
+        TELEMETRY_SDK_LANGUAGE: "python",
+        TELEMETRY_SDK_NAME: "opentelemetry",
+        TELEMETRY_SDK_VERSION: otel_sdk_version,
         "service.name": "kubeflow-training-demo",
         "service.version": "0.2.0",
-    })
-    provider = TracerProvider(resource=resource)
+    }))
+    # Head sampling caps export volume; the default ratio of 1.0 keeps every
+    # trace. Child spans follow their parent's decision so traces stay whole.
+    ratio = _env_ratio("OTEL_TRACES_SAMPLER_ARG", 1.0)
+    provider = TracerProvider(
+        resource=resource,
+        sampler=ParentBased(TraceIdRatioBased(ratio)),
+    )
 
     if _collector_available():
+        import grpc
         from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-        exporter = OTLPSpanExporter(endpoint="http://localhost:4317", insecure=True)
+        # gzip shrinks export payloads; keepalive pings hold the HTTP/2 channel
+        # open between batches instead of letting it be torn down and redialled.
+        exporter = OTLPSpanExporter(
+            endpoint="http://localhost:4317",
+            insecure=True,
+            compression=grpc.Compression.Gzip,
+            channel_options=(
+                ("grpc.keepalive_time_ms", 30000),
+                ("grpc.keepalive_timeout_ms", 10000),
+                ("grpc.http2.max_pings_without_data", 0),
+                ("grpc.keepalive_permit_without_calls", 1),
+            ),
+        )
         target = "OTLP → Collector → Jaeger"
     else:
-        exporter = ConsoleSpanExporter()
+        if os.getenv("DEMO_CONSOLE_FULL_SPANS") == "1":
+            exporter = ConsoleSpanExporter()
+        else:
+            exporter = ConsoleSpanExporter(formatter=_format_span_line)
         target = "Console (OTel Collector not reachable on :4317)"
 
-    provider.add_span_processor(BatchSpanProcessor(exporter))
+    provider.add_span_processor(_make_bsp(exporter))
     return provider, target
 
 
@@ -72,9 +190,11 @@ def run_demo() -> None:
     client = MockTrainerClient(namespace="ml-team")
     app_tracer = trace.get_tracer("kubeflow-training-demo")
 
-    with app_tracer.start_as_current_span("fine_tune_workflow") as root:
-        root.set_attribute("workflow.name", "llm-fine-tuning")
-
+    # Attributes passed at span start are applied in one pass and are visible
+    # to the sampler, instead of a separate set_attribute() call afterwards.
+    with app_tracer.start_as_current_span(
+        "fine_tune_workflow", attributes=_WORKFLOW_ATTRS
+    ) as root:
         # train() emits two spans beneath this one:
         #   MockTrainerClient.train (INTERNAL) → MockKubernetesBackend.train (CLIENT)
         job_name = client.train(
@@ -11,7 +11,7 @@ import uuid
 
 from opentelemetry.trace import SpanKind, StatusCode
 
-from sdk_mock.observability import make_tracer
+from sdk_mock.observability import LazyTracer
 from sdk_mock.observability.attributes import (
     BACKEND_KIND,
     JOB_NAME,
@@ -22,7 +22,7 @@ from sdk_mock.observability.attributes import (
 )
 from sdk_mock.observability.propagation import trace_env_vars
 
-_tracer = make_tracer()
+_tracer = LazyTracer()
 
 
 class MockKubernetesBackend:
@@ -1,7 +1,7 @@
 """Shared observability primitives for the Kubeflow SDK mock.
 
-Library code calls make_tracer() / make_meter() rather than the OTel globals
-directly so we have a single place to set the instrumentation scope, version,
+Library code uses LazyTracer (which wraps make_tracer()) / make_meter() rather
+than the OTel globals directly so we have a single place to set the instrumentation scope, version,
 and schema URL.
 
 Depends on opentelemetry-api only — no SDK import here.
@@ -18,6 +18,30 @@ def make_tracer() -> trace.Tracer:
     return trace.get_tracer(INSTRUMENTATION_SCOPE, _VERSION, schema_url=SCHEMA_URL)
 
 
+class LazyTracer(trace.Tracer):
+    """Tracer that defers make_tracer() until the first span is started.
+
+    Library modules assign one at import as their module-level ``_tracer``, so
+    importing the SDK performs no tracer lookup. Tests may still patch
+    ``_tracer`` with a real tracer.
+    """
+
+    def __init__(self) -> None:
+        self._delegate: trace.Tracer | None = None
+
+    def resolve(self) -> trace.Tracer:
+        """Return the underlying tracer, creating it on first call."""
+        if self._delegate is None:
+            self._delegate = make_tracer()
+        return self._delegate
+
+    def start_span(self, *args, **kwargs) -> trace.Span:
+        return self.resolve().start_span(*args, **kwargs)
+
+    def start_as_current_span(self, *args, **kwargs):
+        return self.resolve().start_as_current_span(*args, **kwargs)
+
+
 def make_meter() -> metrics.Meter:
     """Return a Meter bound to the Kubeflow SDK instrumentation scope."""
     return metrics.get_meter(INSTRUMENTATION_SCOPE, _VERSION, schema_url=SCHEMA_URL)
@@ -8,6 +8,7 @@ remote training job to continue the same distributed trace.
 """
 
 from opentelemetry import propagate
+from opentelemetry.trace import get_current_span
 
 
 def inject_context_to_env() -> dict[str, str]:
@@ -16,17 +17,28 @@ def inject_context_to_env() -> dict[str, str]:
     variables suitable for injection into a Kubernetes Pod spec.
 
     Returns:
-        A dict like {"TRACEPARENT": "00-<trace_id>-<span_id>-01"}
+        A dict like {"TRACEPARENT": "00-<trace_id>-<span_id>-01"}, or {}
+        when there is no active trace.
     """
+    # Nothing to propagate without an active trace — skip the propagator.
+    if not get_current_span().get_span_context().is_valid:
+        return {}
+
+    # Call the configured propagator directly rather than via propagate.inject().
+    # It is looked up per call, not cached at import, so a later
+    # set_global_textmap() still takes effect; default_setter is already a
+    # module-level singleton in the API.
     carrier: dict[str, str] = {}
-    propagate.inject(carrier)
+    propagate.get_global_textmap().inject(carrier)
 
     # W3C standard uses lowercase 'traceparent',
     # but Kubernetes env vars are conventionally UPPERCASE.
     env_vars: dict[str, str] = {}
-    if "traceparent" in carrier:
-        env_vars["TRACEPARENT"] = carrier["traceparent"]
-    if "tracestate" in carrier:
-        env_vars["TRACESTATE"] = carrier["tracestate"]
+    traceparent = carrier.get("traceparent")
+    if traceparent:
+        env_vars["TRACEPARENT"] = traceparent
+    tracestate = carrier.get("tracestate")
+    if tracestate:
+        env_vars["TRACESTATE"] = tracestate
 
     return env_vars
@@ -13,11 +13,13 @@ Sub-operations within the backend are span events, not child spans, so traces
 stay readable without losing debugging detail.
 """
 import time
+from contextlib import nullcontext
 
-from opentelemetry.trace import SpanKind, StatusCode
+from opentelemetry import trace
+from opentelemetry.trace import INVALID_SPAN, SpanKind, Status, StatusCode
 
 from .backends import MockKubernetesBackend
-from .observability import make_meter, make_tracer
+from .observability import LazyTracer, make_meter
 from .observability.attributes import (
     BACKEND_KIND,
     ERROR_KIND,
@@ -30,9 +32,23 @@ from .observability.attributes import (
     TRAINER_KIND,
 )
 
-_tracer = make_tracer()
+_tracer = LazyTracer()
 _meter  = make_meter()
 
+
+def _tracing_disabled() -> bool:
+    """True when no TracerProvider is configured, so every span would be a no-op.
+
+    Checked per call rather than at import: applications usually install their
+    provider after importing the SDK, and the proxy tracer picks it up then.
+    """
+    tracer = _tracer.resolve() if isinstance(_tracer, LazyTracer) else _tracer
+    return isinstance(tracer, trace.NoOpTracer) or (
+        isinstance(tracer, trace.ProxyTracer)
+        and isinstance(trace.get_tracer_provider(), trace.ProxyTracerProvider)
+    )
+
+
 # ── Instruments ────────────────────────────────────────────────────────────────
 # Metric names use a shorter "kf.*" prefix to distinguish this PoC's scope
 # from the full SDK's "kubeflow.*" production namespace.
@@ -58,6 +74,13 @@ _failures = _meter.create_counter(
     description="Total operation failures, dimensioned by error class and operation.",
 )
 
+# Reused on every call instead of being rebuilt per operation.
+# The attribute dicts are shared — do not mutate.
+_OK_STATUS        = Status(StatusCode.OK)
+_K8S_ATTRS        = {BACKEND_KIND: "kubernetes"}
+_TRAIN_OP_ATTRS   = {OPERATION: "train", BACKEND_KIND: "kubernetes"}
+_GET_JOB_OP_ATTRS = {OPERATION: "get_job", BACKEND_KIND: "kubernetes"}
+
 
 class MockTrainerClient:
     """Simulates TrainerClient from the Kubeflow Training SDK.
@@ -79,28 +102,42 @@ class MockTrainerClient:
     ) -> str:
         """Submit a training job and return the job name."""
         t0 = time.perf_counter()
-        with _tracer.start_as_current_span(
-            "MockTrainerClient.train",
-            kind=SpanKind.INTERNAL,
-        ) as span:
-            span.set_attribute(TRAINER_KIND, trainer_kind)
-            span.set_attribute(RUNTIME_NAME, runtime)
-            span.set_attribute(NODE_COUNT, num_nodes)
-
-            # Only record gen_ai.request.model when there is actually a model
-            # URI present. gen_ai.usage.* attributes are for inference, not training.
-            if model_name:
-                span.set_attribute(MODEL_NAME, model_name)
+        # Without a provider, skip span creation and context attach/detach
+        # altogether; INVALID_SPAN absorbs the error-path calls below.
+        if _tracing_disabled():
+            span_cm = nullcontext(INVALID_SPAN)
+        else:
+            span_cm = _tracer.start_as_current_span(
+                "MockTrainerClient.train",
+                kind=SpanKind.INTERNAL,
+            )
+        with span_cm as span:
+            # With no TracerProvider configured the span is non-recording: skip
+            # all span bookkeeping so the call costs only the backend + metrics.
+            # Attributes go in one set_attributes() call instead of one per key.
+            recording = span.is_recording()
+            if recording:
+                attrs = {
+                    TRAINER_KIND: trainer_kind,
+                    RUNTIME_NAME: runtime,
+                    NODE_COUNT: num_nodes,
+                }
+                # Only record gen_ai.request.model when there is actually a model
+                # URI present. gen_ai.usage.* attributes are for inference, not training.
+                if model_name:
+                    attrs[MODEL_NAME] = model_name
+                span.set_attributes(attrs)
 
             try:
                 job_name = self._backend.train(
                     trainer_kind=trainer_kind, runtime=runtime
                 )
-                span.set_attribute(JOB_NAME, job_name)
-                span.set_status(StatusCode.OK)
+                if recording:
+                    span.set_attribute(JOB_NAME, job_name)
+                    span.set_status(_OK_STATUS)
 
                 _jobs_submitted.add(1, {BACKEND_KIND: "kubernetes", TRAINER_KIND: trainer_kind})
-                _jobs_running.add(1, {BACKEND_KIND: "kubernetes"})
+                _jobs_running.add(1, _K8S_ATTRS)
                 return job_name
 
             except Exception as exc:
@@ -113,10 +150,7 @@ class MockTrainerClient:
                 raise
 
             finally:
-                _op_latency.record(
-                    time.perf_counter() - t0,
-                    {OPERATION: "train", BACKEND_KIND: "kubernetes"},
-                )
+                _op_latency.record(time.perf_counter() - t0, _TRAIN_OP_ATTRS)
 
     def get_job(self, job_name: str) -> dict:
         """Fetch current job status."""
@@ -130,7 +164,7 @@ class MockTrainerClient:
             try:
                 result = self._backend.get_job(job_name)
                 span.set_attribute(JOB_STATUS, result["status"])
-                span.set_status(StatusCode.OK)
+                span.set_status(_OK_STATUS)
                 return result
 
             except Exception as exc:
@@ -143,7 +177,4 @@ class MockTrainerClient:
                 raise
 
             finally:
-                _op_latency.record(
-                    time.perf_counter() - t0,
-                    {OPERATION: "get_job", BACKEND_KIND: "kubernetes"},
-                )
+                _op_latency.record(time.perf_counter() - t0, _GET_JOB_OP_ATTRS)
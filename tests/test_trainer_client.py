@@ -9,12 +9,27 @@ Test categories:
   - Attributes       — correct keys and values per operation
   - ErrorRecording   — set_status(ERROR) + record_exception on every failure path
   - NoopBehavior     — SDK works normally when no TracerProvider is configured
-  - Propagation      — TRACEPARENT injected as a backend span event
+  - Propagation      — TRACEPARENT/TRACESTATE env vars and the backend injection event
 """
-import pytest
-from opentelemetry.trace import SpanKind, StatusCode
+from unittest.mock import patch
 
-from sdk_mock.trainer_client import MockTrainerClient
+import pytest
+from opentelemetry import baggage, context
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.trace import (
+    NonRecordingSpan,
+    SpanContext,
+    SpanKind,
+    StatusCode,
+    TraceFlags,
+    TraceState,
+    use_span,
+)
+from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+
+from sdk_mock.observability.propagation import trace_env_vars
+from sdk_mock.propagator import inject_context_to_env
+from sdk_mock.trainer_client import MockTrainerClient, _tracing_disabled
 from tests.helpers import capture_spans
 
 
@@ -175,6 +190,21 @@ class TestNoopBehavior:
         assert result is not None
         assert result.startswith("train-")
 
+    def test_client_span_skipped_without_provider(self):
+        class _Backend:
+            def train(self, **_):
+                return "fake-job"
+
+        assert _tracing_disabled()
+        # The stub backend opens no span, so any context attach would come from
+        # train() entering a client span.
+        with patch("opentelemetry.context.attach", wraps=context.attach) as attach:
+            assert MockTrainerClient(backend=_Backend()).train() == "fake-job"
+        attach.assert_not_called()
+
+        with capture_spans():
+            assert not _tracing_disabled()
+
 
 # ── Context propagation ────────────────────────────────────────────────────────
 
@@ -186,3 +216,45 @@ class TestContextPropagation:
         backend = _span(rec.get_finished_spans(), "MockKubernetesBackend.train")
         event_names = [e.name for e in backend.events]
         assert "traceparent_injected" in event_names
+
+    @pytest.mark.parametrize("to_env", [trace_env_vars, inject_context_to_env])
+    def test_no_env_vars_without_active_span(self, to_env):
+        assert to_env() == {}
+
+    @pytest.mark.parametrize("to_env", [trace_env_vars, inject_context_to_env])
+    def test_env_vars_match_propagator_output(self, to_env):
+        tracer = TracerProvider().get_tracer("test")
+        with tracer.start_as_current_span("parent"):
+            carrier: dict[str, str] = {}
+            TraceContextTextMapPropagator().inject(carrier)
+            assert to_env() == {k.upper(): v for k, v in carrier.items()}
+
+    @pytest.mark.parametrize("to_env", [trace_env_vars, inject_context_to_env])
+    def test_tracestate_forwarded(self, to_env):
+        span_ctx = SpanContext(
+            trace_id=0x1234,
+            span_id=0x5678,
+            is_remote=False,
+            trace_flags=TraceFlags(TraceFlags.SAMPLED),
+            trace_state=TraceState([("vendor", "value")]),
+        )
+        with use_span(NonRecordingSpan(span_ctx)):
+            assert to_env()["TRACESTATE"] == "vendor=value"
+
+    @pytest.mark.parametrize("to_env", [trace_env_vars, inject_context_to_env])
+    def test_baggage_not_forwarded(self, to_env):
+        token = context.attach(baggage.set_baggage("user.id", "42"))
+        try:
+            tracer = TracerProvider().get_tracer("test")
+            with tracer.start_as_current_span("parent"):
+                assert set(to_env()) == {"TRACEPARENT"}
+        finally:
+            context.detach(token)
+
+    def test_env_vars_follow_trace_changes(self):
+        tracer = TracerProvider().get_tracer("test")
+        for _ in range(2):
+            with tracer.start_as_current_span("parent"):
+                carrier: dict[str, str] = {}
+                TraceContextTextMapPropagator().inject(carrier)
+                assert trace_env_vars()["TRACEPARENT"] == carrier["traceparent"]